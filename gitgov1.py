@@ -7,16 +7,74 @@ Creator: David Muigai — Nairobi, Kenya
 
 import os
 import sys
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import subprocess
 import json
 import getpass
+import hashlib
 import re
-from datetime import datetime
-from urllib.parse import urlparse
-import requests
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 import platform
 import shutil
+import string
+import threading
+
+# Optional and slow to import, so loaded on first use (see _load_pygit2); without it everything uses the git CLI
+pygit2 = None
+_PYGIT2_LOADED = False
+
+if sys.platform == 'win32':
+    import winreg
+else:  # The PATH helpers report that they need Windows
+    winreg = None
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:  # Optional: the stdlib json module produces the same files
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    _loads = json.loads
+
+_PLATFORM = platform.system()
+# Directory gitgo is run from; this is what the PATH helpers add and remove
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Extra Popen arguments for captured read-only git queries: on Windows, skip allocating a console per spawn
+_NO_WINDOW = {}
+if sys.platform == 'win32':
+    _SI = subprocess.STARTUPINFO()
+    _SI.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _NO_WINDOW = {'startupinfo': _SI, 'creationflags': subprocess.CREATE_NO_WINDOW}
+
+# Repo metadata responses kept between runs, so a re-check can revalidate with If-None-Match
+API_CACHE_PATH = os.path.join(str(Path.home()), ".gitgo", "cache.json")
+API_CACHE_MAX_AGE = 24 * 3600
+
+# Executable lookups, cached so each PATH scan happens once per process
+_WHICH_CACHE = {}
+
+
+def _which(name):
+    """shutil.which() with the result cached"""
+    if name not in _WHICH_CACHE:
+        _WHICH_CACHE[name] = shutil.which(name)
+    return _WHICH_CACHE[name]
+
+
+# Clipboard command for public keys: clip (Windows), pbcopy (macOS), xclip (Linux) or None
+_CLIP_CMD = {"Windows": ["clip"], "Darwin": ["pbcopy"]}.get(_PLATFORM) or (
+    ["xclip", "-selection", "clipboard"] if _which("xclip") else None
+)
 
 
 def safe_input(prompt):
@@ -27,6 +85,257 @@ def safe_input(prompt):
         sys.exit(0)
 
 
+class _AliasTable(dict):
+    """str.translate table for SSH aliases: keeps a-z and 0-9, maps every other character to '_'"""
+
+    def __missing__(self, ordinal):
+        return '_'
+
+
+_ALIAS_TABLE = _AliasTable((ord(c), c) for c in string.ascii_lowercase + string.digits)
+
+# Conventional commit prefixes offered by the commit menu, in menu order
+COMMIT_TEMPLATES = [
+    ("feat: ", "add new feature"),
+    ("fix: ", "bug fix"),
+    ("docs: ", "update documentation"),
+    ("style: ", "formatting changes"),
+    ("refactor: ", "code refactoring"),
+    ("test: ", "add or update tests"),
+    ("chore: ", "maintenance tasks")
+]
+
+# GitHub's allowed repository name format
+_REPO_NAME_RE = re.compile(r'^[a-zA-Z0-9._-]{1,100}\Z')
+
+# Loose email shape check for adduser; \Z so a trailing newline is not accepted
+_EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+\Z')
+
+# Only the repository fields delremote shows, instead of the full REST payload
+GRAPHQL_URL = 'https://api.github.com/graphql'
+REPO_SUMMARY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { nameWithOwner isPrivate updatedAt }
+}
+"""
+
+# Concurrent GitHub API requests; matches the session's connection pool size
+GH_MAX_WORKERS = 8
+
+# Longest rate-limit pause worth sitting through at an interactive prompt
+RATE_LIMIT_MAX_WAIT = 60
+
+# How long a repository existence check (found or not found) is trusted before asking GitHub again
+REPO_STATUS_TTL = 60
+
+
+class RateLimiter:
+    """Token bucket per GitHub token and quota, kept in step with GitHub's X-RateLimit headers"""
+
+    def __init__(self, rate=5000, per=3600.0):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        # (token hash, resource) -> [tokens, last refill, blocked until] (monotonic clock)
+        self._buckets = {}
+        # Paged listings call acquire/update from worker threads
+        self._lock = threading.Lock()
+
+    def acquire(self, key, cost=1):
+        """Take cost tokens from key's bucket and return how many seconds to wait before sending"""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(key, [self.capacity, now, 0.0])
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.fill_rate)
+            bucket[1] = now
+            wait = max(bucket[2] - now, (cost - bucket[0]) / self.fill_rate, 0.0)
+            bucket[0] -= cost
+            return wait
+
+    def update(self, key, headers):
+        """Sync key's bucket with the remaining quota, reset time and Retry-After GitHub reported"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return
+            now = time.monotonic()
+            remaining = headers.get('X-RateLimit-Remaining')
+            if remaining is not None and remaining.isdigit():
+                bucket[0] = min(bucket[0], int(remaining))
+                reset = headers.get('X-RateLimit-Reset')
+                if int(remaining) == 0 and reset and reset.isdigit():
+                    bucket[2] = max(bucket[2], now + int(reset) - time.time())
+            retry_after = headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                bucket[2] = max(bucket[2], now + int(retry_after))
+
+
+# File status icons keyed by the first changed column of a porcelain XY code
+STATUS_ICONS = {
+    'M': '📝',   # Modified
+    'A': '➕',   # Added
+    'D': '🗑️',   # Deleted
+    'R': '🔄',   # Renamed
+    'C': '📋',   # Copied
+    '?': '❓'    # Untracked
+}
+
+
+def _iter_porcelain_v2(output):
+    """Yield (XY, path) byte pairs from 'git status --porcelain=v2 -z' output"""
+    records = iter(output.split(b'\0'))
+    for record in records:
+        kind = record[:1]
+        if kind == b'1':
+            yield record[2:4], record.split(b' ', 8)[8]
+        elif kind == b'2':
+            yield record[2:4], record.split(b' ', 9)[9]
+            next(records, None)  # Skip the rename/copy source path
+        elif kind == b'u':
+            yield record[2:4], record.split(b' ', 10)[10]
+        elif kind == b'?':
+            yield b'??', record[2:]
+
+
+# Branch, upstream and tracked changes from one 'git status --porcelain=v2 --branch' call
+RepoStatus = namedtuple('RepoStatus', ['branch', 'upstream', 'changes'])
+
+
+# Read-only git query results are reused for this many seconds (LRU of GIT_CACHE_SIZE entries)
+GIT_CACHE_TTL = 2.0
+GIT_CACHE_SIZE = 64
+
+_LISTING_FLAGS = {'-v', '--verbose', '-r', '-a', '--all', '--list', '-l', '--show-current',
+                  '--get', '--get-all', '--get-regexp', 'get-url'}
+_SCOPE_FLAGS = {'--global', '--local', '--system', '--worktree', '-z', '--null', '--show-scope'}
+
+
+def _is_read_only_git(cmd):
+    """Return True for git invocations that only query the repository"""
+    subcommand, args = cmd[0], cmd[1:]
+    if subcommand in ('status', 'rev-parse', 'log', 'diff', 'shortlog', 'show'):
+        return True
+    if subcommand == 'symbolic-ref':
+        # 'git symbolic-ref HEAD' reads, 'git symbolic-ref HEAD <ref>' and -d write
+        operands = [arg for arg in args if not arg.startswith('-')]
+        return len(operands) == 1 and all(arg in ('--short', '-q', '--quiet') for arg in args if arg.startswith('-'))
+    if subcommand in ('remote', 'branch'):
+        return not args or args[0] in _LISTING_FLAGS
+    if subcommand == 'config':
+        # 'git config <key>' reads, 'git config <key> <value>' writes
+        plain_args = [arg for arg in args if arg not in _SCOPE_FLAGS]
+        return bool(_LISTING_FLAGS.intersection(args)) or len(plain_args) == 1
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _git_dir(cwd):
+    """Return the git directory for cwd, or None when cwd is not inside a repository"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--git-dir'], cwd=cwd,
+                              capture_output=True, text=True, check=True, **_NO_WINDOW).stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+async def _git_async(args):
+    """Run one git command without blocking the event loop"""
+    import asyncio
+    proc = await asyncio.create_subprocess_exec(
+        'git', *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, **_NO_WINDOW
+    )
+    stdout, stderr = await proc.communicate()
+    return (stdout.decode(errors='replace').strip(), stderr.decode(errors='replace').strip(),
+            proc.returncode)
+
+
+async def _git_queries(commands):
+    """Run several git commands concurrently"""
+    import asyncio
+    return await asyncio.gather(*(_git_async(cmd) for cmd in commands))
+
+
+async def _generate_ssh_key(email, key_path):
+    """Run ssh-keygen for one ed25519 key with an empty passphrase and return its exit code"""
+    import asyncio
+    proc = await asyncio.create_subprocess_exec(
+        "ssh-keygen", "-t", "ed25519", "-C", email, "-f", key_path,
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    await proc.communicate(b"\n\n")
+    return proc.returncode
+
+
+async def _generate_ssh_keys(jobs):
+    """Generate several SSH keys concurrently from (email, key_path) pairs"""
+    import asyncio
+    return await asyncio.gather(*(_generate_ssh_key(email, key_path) for email, key_path in jobs),
+                                return_exceptions=True)
+
+
+async def _test_ssh_connection(account):
+    """Run 'ssh -T' against an account alias and return its combined output"""
+    import asyncio
+    # Use -o StrictHostKeyChecking=no to avoid host key verification prompts
+    proc = await asyncio.create_subprocess_exec(
+        "ssh", "-o", "StrictHostKeyChecking=no", "-T", f"git@{account['sshAlias']}",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return (stdout + stderr).decode(errors='replace')
+
+
+async def _test_ssh_connections(accounts):
+    """Test SSH connections for all accounts concurrently"""
+    import asyncio
+    return await asyncio.gather(*(_test_ssh_connection(account) for account in accounts),
+                                return_exceptions=True)
+
+
+def _load_pygit2():
+    """Import pygit2 the first time a repository handle is needed; None when it is not installed"""
+    global pygit2, _PYGIT2_LOADED
+    if not _PYGIT2_LOADED:
+        _PYGIT2_LOADED = True
+        try:
+            import pygit2 as module
+        except ImportError:
+            module = None
+        pygit2 = module
+    return pygit2
+
+
+def _parse_gh_ts(value):
+    """Parse a GitHub timestamp such as '2024-01-15T09:30:00Z' into an aware UTC datetime"""
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value)
+
+
+def _load_user_path(key):
+    """Return the user PATH entries from an open Environment registry key, plus their normcase'd set"""
+    try:
+        current_path, _ = winreg.QueryValueEx(key, 'Path')
+    except FileNotFoundError:
+        current_path = ''
+    paths = [p for p in current_path.split(';') if p]
+    return paths, {os.path.normcase(p) for p in paths}
+
+
+def _broadcast_environment_change():
+    """Tell running programs (Explorer, new terminals) that the user environment changed"""
+    import ctypes
+    HWND_BROADCAST, WM_SETTINGCHANGE, SMTO_ABORTIFHUNG = 0xFFFF, 0x001A, 0x0002
+    result = ctypes.c_ulong()
+    ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment",
+                                             SMTO_ABORTIFHUNG, 5000, ctypes.byref(result))
+
+
 def generate_github_ssh_keys_and_config():
     """Generate GitHub SSH keys and configure SSH for multiple GitHub accounts"""
     # Determine home directory based on platform
@@ -34,15 +343,20 @@ def generate_github_ssh_keys_and_config():
     ssh_dir = os.path.join(home_dir, ".ssh")
     config_path = os.path.join(ssh_dir, "config")
     accounts_config_path = os.path.join(ssh_dir, "accounts.json")
-    config_entries = []
     accounts_data = []
     
-    # Ensure .ssh directory exists
-    print("🔧 Creating .ssh directory..." if not os.path.exists(ssh_dir) else "🔧 .ssh directory exists")
-    os.makedirs(ssh_dir, exist_ok=True)
+    # Ensure .ssh directory exists; one listing answers every key-exists check below
+    try:
+        existing_files = {entry.name for entry in os.scandir(ssh_dir)}
+        print("🔧 .ssh directory exists")
+    except FileNotFoundError:
+        print("🔧 Creating .ssh directory...")
+        # Keep ~/.ssh private; it also holds the ControlMaster sockets
+        os.makedirs(ssh_dir, mode=0o700, exist_ok=True)
+        existing_files = set()
     
     # Check if ssh-keygen is available
-    if shutil.which("ssh-keygen") is None:
+    if _which("ssh-keygen") is None:
         print("❌ 'ssh-keygen' not found. Please install OpenSSH Client.")
         return
     
@@ -56,6 +370,8 @@ def generate_github_ssh_keys_and_config():
         except ValueError:
             print("❌ Please enter a valid number.")
     
+    # Prompts share one stdin, so collect every account's details first
+    pending_accounts = []
     for i in range(1, count + 1):
         print(f"\n🧑‍💻 Account #{i} setup")
         account_type = safe_input("Enter account name/type (e.g., personal, work, freelance): ")
@@ -68,135 +384,140 @@ def generate_github_ssh_keys_and_config():
             local_username = username
         
         # Create alias and key names
-        alias = "github-" + re.sub(r'[^a-z0-9]', '_', account_type.lower().strip())
+        alias = "github-" + account_type.lower().strip().translate(_ALIAS_TABLE)
         key_name = f"id_ed25519_{alias}"
         key_path = os.path.join(ssh_dir, key_name)
-        pub_key_path = f"{key_path}.pub"
-        
-        # Generate SSH key
-        if os.path.exists(key_path):
+        pending_accounts.append((account_type, email, username, local_username, alias, key_name, key_path))
+    
+    # Generate all missing SSH keys concurrently
+    keys_to_generate = {}
+    for account_type, email, _, _, _, key_name, key_path in pending_accounts:
+        if key_name in existing_files or key_path in keys_to_generate:
             print(f"⚠️ Key '{key_name}' already exists. Skipping generation.")
         else:
             print(f"🔐 Generating SSH key for '{account_type}'...")
-            try:
-                subprocess.run(
-                    ["ssh-keygen", "-t", "ed25519", "-C", email, "-f", key_path],
-                    check=True, input=b"\n\n", capture_output=True
-                )
-                if os.path.exists(key_path):
-                    print(f"✅ Key generated: {key_path}")
-                else:
-                    print(f"❌ Key generation failed for '{account_type}'.")
-                    continue
-            except subprocess.CalledProcessError:
-                print(f"❌ Key generation failed for '{account_type}'.")
+            keys_to_generate[key_path] = (account_type, email)
+    
+    failed_keys = set()
+    import asyncio  # Only SSH setup and batched git queries need the event loop
+
+    results = asyncio.run(_generate_ssh_keys([(email, key_path) for key_path, (_, email) in keys_to_generate.items()]))
+    for (key_path, (account_type, _)), returncode in zip(keys_to_generate.items(), results):
+        if returncode == 0:
+            key_name = os.path.basename(key_path)
+            existing_files.update((key_name, f"{key_name}.pub"))
+            print(f"✅ Key generated: {key_path}")
+        else:
+            print(f"❌ Key generation failed for '{account_type}'.")
+            failed_keys.add(key_path)
+    
+    # Write SSH config entries straight to the file as each account is processed
+    print("\n⚙️ Writing SSH config file...")
+    with open(config_path, 'w', encoding='utf-8') as cfg_f:
+        for account_type, email, username, local_username, alias, key_name, key_path in pending_accounts:
+            if key_path in failed_keys:
                 continue
+            pub_key_path = f"{key_path}.pub"
         
-        # Show public key
-        if os.path.exists(pub_key_path):
-            print(f"\n📋 Public key for '{account_type}' (copy to GitHub):")
-            with open(pub_key_path, 'r') as f:
-                pub_key = f.read().strip()
-                print(pub_key)
+            # Show public key
+            if f"{key_name}.pub" in existing_files:
+                print(f"\n📋 Public key for '{account_type}' (copy to GitHub):")
+                with open(pub_key_path, 'r') as f:
+                    pub_key = f.read().strip()
+                    print(pub_key)
             
-            # Guidance: Add the key to GitHub
-            print("\n🧭 Add this SSH key to your GitHub account:")
-            print("   1) Open: https://github.com/settings/keys")
-            print("   2) Click 'New SSH key'")
-            print("   3) Paste the key above into the 'Key' field and save")
+                # Guidance: Add the key to GitHub
+                print("\n🧭 Add this SSH key to your GitHub account:")
+                print("   1) Open: https://github.com/settings/keys")
+                print("   2) Click 'New SSH key'")
+                print("   3) Paste the key above into the 'Key' field and save")
             
-            # Try to copy to clipboard if on Windows or macOS
-            try:
-                if platform.system() == "Windows":
-                    subprocess.run(["clip"], input=pub_key.encode(), check=True)
-                    print("📌 Public key has been copied to your clipboard.")
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["pbcopy"], input=pub_key.encode(), check=True)
-                    print("📌 Public key has been copied to your clipboard.")
-                else:  # Linux
-                    if shutil.which("xclip"):
-                        subprocess.run(["xclip", "-selection", "clipboard"], input=pub_key.encode(), check=True)
+                # Try to copy to clipboard if on Windows or macOS
+                try:
+                    if _CLIP_CMD:
+                        subprocess.run(_CLIP_CMD, input=pub_key.encode(), check=True)
                         print("📌 Public key has been copied to your clipboard.")
                     else:
                         print("⚠️ Could not copy to clipboard automatically. Please copy it manually.")
-            except Exception:
-                print("⚠️ Could not copy to clipboard automatically. Please copy it manually.")
+                except Exception:
+                    print("⚠️ Could not copy to clipboard automatically. Please copy it manually.")
         
-        # Add SSH config entry
-        entry = f"""# {account_type} GitHub
+            # Add SSH config entry
+            entry = f"""# {account_type} GitHub
 Host {alias}
   HostName github.com
   User git
   IdentityFile ~/.ssh/{key_name}
   IdentitiesOnly yes
 """
-        config_entries.append(entry)
+            if _PLATFORM != "Windows":
+                # Reuse one SSH connection across git operations (Win32-OpenSSH lacks ControlMaster).
+                # %C alone hashes the shared github.com HostName, so the alias keeps each account's socket apart
+                entry += f"""  ControlMaster auto
+  ControlPath ~/.ssh/cm-{alias}-%C
+  ControlPersist 10m
+"""
+            cfg_f.write(entry + "\n")
         
-        # Store account information for later use
-        accounts_data.append({
-            "id": alias,
-            "name": account_type,
-            "sshAlias": alias,
-            "githubUser": username,
-            "email": email,
-            "localGitUser": local_username,
-            "tokenEnvVar": f"GITHUB_{alias.upper().replace('-', '_')}_TOKEN"
-        })
+            # Store account information for later use
+            accounts_data.append({
+                "id": alias,
+                "name": account_type,
+                "sshAlias": alias,
+                "githubUser": username,
+                "email": email,
+                "localGitUser": local_username,
+                "tokenEnvVar": f"GITHUB_{alias.upper().replace('-', '_')}_TOKEN"
+            })
     
-    # Write SSH config file
-    print("\n⚙️ Writing SSH config file...")
-    with open(config_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(config_entries))
     print(f"✅ SSH config saved to: {config_path}")
     
     # Test SSH connections for each account
     print("\n🔍 Testing SSH connections for each account...")
-    for account in accounts_data:
+    # All checks run at once, so the wait is one handshake rather than one per account
+    results = asyncio.run(_test_ssh_connections(accounts_data))
+    for account, output in zip(accounts_data, results):
         print(f"\n🧪 Testing connection to {account['name']} account...")
-        try:
-            # Use -o StrictHostKeyChecking=no to avoid host key verification prompts
-            result = subprocess.run(
-                ["ssh", "-o", "StrictHostKeyChecking=no", "-T", f"git@{account['sshAlias']}"],
-                capture_output=True, text=True, timeout=10
-            )
-            output = result.stdout + result.stderr
-            if "successfully authenticated" in output.lower():
-                print(f"✅ SSH connection successful for {account['name']} account!")
-            else:
-                print(f"⚠️ SSH connection established but authentication message unclear for {account['name']}")
-                print("   → This usually means the key is working but you may need to add it to GitHub")
-        except Exception as e:
+        if isinstance(output, Exception):
             print(f"❌ SSH connection failed for {account['name']} account")
             print("   → Please ensure the SSH key is added to your GitHub account")
+        elif "successfully authenticated" in output.lower():
+            print(f"✅ SSH connection successful for {account['name']} account!")
+        else:
+            print(f"⚠️ SSH connection established but authentication message unclear for {account['name']}")
+            print("   → This usually means the key is working but you may need to add it to GitHub")
     
     # Save account information to JSON file
     print("\n💾 Saving account information...")
-    with open(accounts_config_path, 'w', encoding='utf-8') as f:
-        json.dump(accounts_data, f, indent=2)
+    with open(accounts_config_path, 'wb') as f:
+        f.write(_dumps(accounts_data))
     print(f"✅ Account information saved to: {accounts_config_path}")
 
 class GitGo:
     def handle_changename(self, account, token, github_user):
         """Change the name of a GitHub repository for a chosen account"""
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'User-Agent': 'GitGo-Python-Script'
-        }
         old_name = safe_input("Enter the current repository name: ").strip()
         new_name = safe_input("Enter the new repository name: ").strip()
         if not old_name or not new_name:
             print("❌ Both old and new names are required.")
             return
+        if not (_REPO_NAME_RE.match(old_name) and _REPO_NAME_RE.match(new_name)):
+            print("❌ Invalid repository name. Use only letters, numbers, dots, hyphens, and underscores (max 100 chars).")
+            return
         url = f"https://api.github.com/repos/{github_user}/{old_name}"
         data = {"name": new_name}
         try:
-            response = requests.patch(url, headers=headers, json=data, timeout=20)
+            response = self._gh_request('PATCH', url, token, json=data, timeout=20)
             if response.status_code == 200:
+                payload = response.json()
+                self._set_repo_status(github_user, old_name, token, 404)
+                self._set_repo_status(github_user, new_name, token, 200)
                 print(f"✅ Repository renamed to '{new_name}'.")
-                print(f"   → New URL: {response.json().get('html_url')}")
+                print(f"   → New URL: {payload.get('html_url')}")
             else:
-                print(f"❌ Failed to rename repository: {response.status_code} {response.text}")
+                # Only the failure path decodes the body, and at most its first 500 bytes
+                detail = response.content[:500].decode('utf-8', errors='replace')
+                print(f"❌ Failed to rename repository: {response.status_code} {detail}")
         except Exception as e:
             print(f"❌ Error: {e}")
 
@@ -219,14 +540,14 @@ class GitGo:
             choice = safe_input("\nEnter your choice (1-5): ").strip()
             if choice == "1":
                 # List branches
-                out, _, _ = self.run_git_command(["branch"], check=False)
+                out, _, _ = self._run_branch_command(["branch"])
                 print("\nAvailable branches:")
                 print(out)
             elif choice == "2":
                 # Create new branch
                 new_branch = safe_input("Enter new branch name: ").strip()
                 if new_branch:
-                    out, err, code = self.run_git_command(["branch", new_branch], check=False)
+                    out, err, code = self._run_branch_command(["branch", new_branch])
                     if code == 0:
                         print(f"✅ Branch '{new_branch}' created.")
                     else:
@@ -235,7 +556,7 @@ class GitGo:
                 # Switch branch
                 target_branch = safe_input("Enter branch name to switch to: ").strip()
                 if target_branch:
-                    out, err, code = self.run_git_command(["checkout", target_branch], check=False)
+                    out, err, code = self._run_branch_command(["checkout", target_branch])
                     if code == 0:
                         print(f"✅ Switched to branch '{target_branch}'.")
                     else:
@@ -244,14 +565,14 @@ class GitGo:
                 # Delete branch
                 del_branch = safe_input("Enter branch name to delete: ").strip()
                 if del_branch:
-                    out, err, code = self.run_git_command(["branch", "-d", del_branch], check=False)
+                    out, err, code = self._run_branch_command(["branch", "-d", del_branch])
                     if code == 0:
                         print(f"✅ Branch '{del_branch}' deleted.")
                     else:
                         # Try force delete if normal delete fails
                         confirm = safe_input("Delete failed. Force delete? (y/n): ").strip().lower()
                         if confirm == "y":
-                            out, err, code = self.run_git_command(["branch", "-D", del_branch], check=False)
+                            out, err, code = self._run_branch_command(["branch", "-D", del_branch])
                             if code == 0:
                                 print(f"✅ Branch '{del_branch}' force deleted.")
                             else:
@@ -263,6 +584,57 @@ class GitGo:
                 break
             else:
                 print("❌ Invalid choice. Please enter 1, 2, 3, 4, or 5.")
+
+    def _libgit_repo(self):
+        """Return an in-process pygit2 repository for the current directory, if available"""
+        if _load_pygit2() is None:
+            return None
+        cwd = os.getcwd()
+        if self._repo_cwd != cwd:
+            try:
+                repo_path = pygit2.discover_repository(cwd)
+                self._repo = pygit2.Repository(repo_path) if repo_path else None
+            except pygit2.GitError:
+                # e.g. a repository owned by another user; leave it to git, which applies safe.directory
+                self._repo = None
+            self._repo_cwd = cwd
+        return self._repo
+
+    def _run_branch_command(self, cmd):
+        """Run a branch menu command with pygit2 when installed, otherwise through git"""
+        repo = self._libgit_repo()
+        # Switching stays on git: libgit2 skips post-checkout hooks, filter drivers (LFS) and submodule.recurse
+        if repo is None or cmd[0] == 'checkout':
+            return self.run_git_command(cmd, check=False)
+
+        if cmd != ['branch']:
+            # libgit2 changes the repository behind git's back, so drop memoized git output
+            self._invalidate_git_cache()
+        try:
+            if cmd == ['branch']:
+                current = None if repo.head_is_detached or repo.head_is_unborn else repo.head.shorthand
+                lines = [f"{'*' if name == current else ' '} {name}" for name in sorted(repo.branches.local)]
+                return "\n".join(lines), "", 0
+            if cmd[0] == 'branch' and len(cmd) == 2:
+                repo.branches.local.create(cmd[1], repo.head.peel(pygit2.Commit))
+                return "", "", 0
+            if cmd[0] == 'branch' and cmd[1] in ('-d', '-D'):
+                branch = repo.branches.local[cmd[2]]
+                if branch.is_head():
+                    return "", f"Cannot delete branch '{cmd[2]}' checked out", 1
+                if cmd[1] == '-d':
+                    # Same rule as 'git branch -d': merged into its upstream, or HEAD if none
+                    base = branch.upstream.target if branch.upstream else repo.head.target
+                    if base != branch.target and not repo.descendant_of(base, branch.target):
+                        return "", f"The branch '{cmd[2]}' is not fully merged.", 1
+                branch.delete()
+                return "", "", 0
+        except KeyError:
+            return "", f"branch '{cmd[-1]}' not found.", 1
+        except pygit2.GitError as e:
+            return "", str(e), 1
+        return self.run_git_command(cmd, check=False)
+
     def __init__(self):
         self.valid_actions = [
             "clone", "push", "pull", "adduser", "showuser", "addremote", 
@@ -270,10 +642,71 @@ class GitGo:
             "branch", "remotem", "changename", "help"
         ]
         self.numbered_actions = {str(i+1): action for i, action in enumerate(self.valid_actions)}
+        # The action list never changes, so the menu is laid out once
+        self._menu_str = self._format_actions_menu()
         
+        # Memoized read-only git results: (args, raw, cwd) -> (timestamp, result)
+        self._git_cache = OrderedDict()
+        # Parsed 'git config --list' per working directory: cwd -> (timestamp, dict)
+        self._config_cache = {}
+
+        # In-process libgit2 handle, opened on first use (see _libgit_repo)
+        self._repo = None
+        self._repo_cwd = None
+
         # Load GitHub accounts from config file
         self.accounts = self.load_github_accounts()
+        self._accounts_by_alias = {account.get('sshAlias'): account for account in self.accounts}
+
+        # Shared GitHub API session, created on first use (see the http property)
+        self._http = None
+        self.rate_limiter = RateLimiter()
+
+        # Recent GitHub API responses: (url, token hash) -> (fetched_at, (status, json, headers))
+        self._api_cache = {}
+        # Persisted subset of the API cache, loaded on first use (see _disk_api_cache)
+        self._disk_cache = None
+        # Paged listings revalidate from worker threads; one writer at a time touches the disk cache
+        self._disk_lock = threading.Lock()
+        # Set when persisted responses changed but have not been written yet (see _flush_disk_api_cache)
+        self._disk_dirty = False
+
+        # Repository existence checks: (token hash, user, name) -> (checked_at, 200 or 404)
+        self._repo_status_cache = {}
         
+    @property
+    def http(self):
+        """Shared GitHub API session so calls reuse one keep-alive connection"""
+        return self._ensure_http()
+
+    def _ensure_http(self):
+        """Build the shared session on first use; call it before starting threads that share it"""
+        if self._http is None:
+            # Imported here so commands that never touch the API start without loading requests
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            self._http = requests.Session()
+            self._http.headers.update({
+                'Accept': 'application/vnd.github+json',
+                'User-Agent': 'GitGo-Python-Script',
+                # Repo metadata JSON compresses several times over; per-request headers merge over these
+                'Accept-Encoding': 'gzip, deflate'
+            })
+            # Transient 5xx answers are retried here, so callers only see terminal failures.
+            # POST is left out because repeating a create is not safe
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                            allowed_methods=['HEAD', 'GET', 'DELETE'])
+            self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=GH_MAX_WORKERS, max_retries=retries))
+        return self._http
+
+    def close(self):
+        """Close the shared GitHub API session, if one was opened"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
     def load_github_accounts(self):
         """Load GitHub accounts from the config file created during SSH setup"""
         home_dir = str(Path.home())
@@ -281,8 +714,8 @@ class GitGo:
         
         if os.path.exists(accounts_config_path):
             try:
-                with open(accounts_config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(accounts_config_path, 'rb') as f:
+                    return _loads(f.read())
             except Exception as e:
                 print(f"⚠️ Error loading accounts: {str(e)}")
                 return []
@@ -370,48 +803,6 @@ class GitGo:
         
         return token
         
-    def handle_showuser(self):
-        """Display current Git identity configuration"""
-        # Get current repository configuration
-        try:
-            current_name = subprocess.run(["git", "config", "user.name"], capture_output=True, text=True).stdout.strip()
-        except:
-            current_name = None
-            
-        try:
-            current_email = subprocess.run(["git", "config", "user.email"], capture_output=True, text=True).stdout.strip()
-        except:
-            current_email = None
-            
-        # Get global configuration
-        try:
-            global_name = subprocess.run(["git", "config", "--global", "user.name"], capture_output=True, text=True).stdout.strip()
-        except:
-            global_name = None
-            
-        try:
-            global_email = subprocess.run(["git", "config", "--global", "user.email"], capture_output=True, text=True).stdout.strip()
-        except:
-            global_email = None
-        
-        print("\n👤 Git Identity Configuration:")
-        print("──────────────────────────────────────────────")
-        
-        # Check if current directory is a git repository
-        is_git_repo = os.path.exists(".git")
-        
-        if is_git_repo:
-            print("📁 Current Repository:")
-            print(f"  → Name: {current_name if current_name else '(not set)'}")
-            print(f"  → Email: {current_email if current_email else '(not set)'}")
-        else:
-            print("📁 Current Directory: (not a Git repository)")
-        
-        print("\n🌍 Global Configuration:")
-        print(f"  → Name: {global_name if global_name else '(not set)'}")
-        print(f"  → Email: {global_email if global_email else '(not set)'}")
-        print()
-
     def set_github_tokens(self):
         """Setup GitHub tokens securely"""
         print("\n🔐 GitHub Token Setup")
@@ -447,30 +838,229 @@ class GitGo:
         except Exception as e:
             print(f"\n❌ Token setup failed: {str(e)}")
 
+    def _api_cache_key(self, url, token):
+        """Key API cache entries by URL and a hash of the token (never the token itself)"""
+        return (url, hashlib.sha256(token.encode()).hexdigest())
+
+    def _gh_request(self, method, url, token, headers=None, **kwargs):
+        """Send a GitHub API request on the shared session, pacing it with the token's rate limit"""
+        import requests
+
+        # GraphQL and search have their own quotas, reported in the same X-RateLimit headers
+        resource = 'graphql' if url == GRAPHQL_URL else 'search' if '/search/' in url else 'core'
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        key = (token_hash, resource)
+        headers = {'Authorization': f'Bearer {token}', **(headers or {})}
+        for attempt in range(2):
+            wait = self.rate_limiter.acquire(key)
+            if wait > RATE_LIMIT_MAX_WAIT:
+                raise requests.exceptions.RequestException(
+                    f"GitHub rate limit reached for this token; try again in {int(wait // 60) + 1} min"
+                )
+            if wait > 0:
+                print(f"⏳ GitHub rate limit: waiting {wait:.0f}s...")
+                time.sleep(wait)
+            response = self.http.request(method, url, headers=headers, **kwargs)
+            self.rate_limiter.update((token_hash, response.headers.get('X-RateLimit-Resource', resource)),
+                                     response.headers)
+            # Secondary limits answer 403/429 with Retry-After; the request was not acted on, so retry once
+            if response.status_code not in (403, 429) or 'Retry-After' not in response.headers or attempt:
+                return response
+        return response
+
+    def _disk_api_cache(self):
+        """Load the on-disk API cache the first time it is needed"""
+        if self._disk_cache is None:
+            try:
+                with open(API_CACHE_PATH, 'rb') as f:
+                    self._disk_cache = _loads(f.read())
+            except (OSError, ValueError):
+                self._disk_cache = {}
+        return self._disk_cache
+
+    def _save_disk_api_cache(self):
+        """Write the on-disk API cache back, dropping entries too old to be worth revalidating"""
+        now = time.time()
+        self._disk_cache = {k: v for k, v in self._disk_api_cache().items() if now - v['ts'] < API_CACHE_MAX_AGE}
+        tmp_path = API_CACHE_PATH + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(API_CACHE_PATH), mode=0o700, exist_ok=True)
+            # Private repo metadata lives here, so the file is only readable by its owner
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+                f.write(_dumps(self._disk_cache))
+            os.replace(tmp_path, API_CACHE_PATH)
+        except OSError:
+            pass  # The cache only saves requests; never fail a command over it
+        self._disk_dirty = False
+
+    def _flush_disk_api_cache(self):
+        """Write the on-disk API cache once if persisted responses changed since the last save"""
+        if self._disk_dirty:
+            self._save_disk_api_cache()
+
+    def _forget_api_response(self, url, token):
+        """Drop a cached response once it is known to be out of date"""
+        key = self._api_cache_key(url, token)
+        self._api_cache.pop(key, None)
+        if self._disk_api_cache().pop(f"{key[1]} {url}", None) is not None:
+            self._save_disk_api_cache()
+
+    def _repo_status_key(self, owner, name, token):
+        """Key existence checks by token hash and lowercased names (GitHub names are case-insensitive)"""
+        return (hashlib.sha256(token.encode()).hexdigest(), owner.lower(), name.lower())
+
+    def _repo_status(self, owner, name, token):
+        """Return the HEAD status for owner/name, reusing a 200/404 answered in the last REPO_STATUS_TTL seconds"""
+        key = self._repo_status_key(owner, name, token)
+        cached = self._repo_status_cache.get(key)
+        if cached is not None and time.time() - cached[0] < REPO_STATUS_TTL:
+            return cached[1]
+        # HEAD carries no body, so a mistyped name costs no JSON download or decode
+        status = self._gh_request('HEAD', f'https://api.github.com/repos/{owner}/{name}', token,
+                                  timeout=10).status_code
+        if status in (200, 404):
+            self._set_repo_status(owner, name, token, status)
+        return status
+
+    def _set_repo_status(self, owner, name, token, status):
+        """Record a known existence status, e.g. right after creating or deleting a repository"""
+        self._repo_status_cache[self._repo_status_key(owner, name, token)] = (time.time(), status)
+
+    def _gh_get(self, url, token, ttl=300, refresh=False, timeout=10, persist=False):
+        """GET a GitHub API URL, reusing a recent successful response for the same token
+
+        persist=True also keeps the response on disk (API_CACHE_PATH) for later runs once the caller
+        calls _flush_disk_api_cache(), so a batch of requests rewrites the file only once.
+        """
+        key = self._api_cache_key(url, token)
+        disk_key = f"{key[1]} {url}"
+        cached = self._api_cache.get(key)
+        if cached is None and persist:
+            entry = self._disk_api_cache().get(disk_key)
+            if entry:
+                from requests.structures import CaseInsensitiveDict
+                headers = CaseInsensitiveDict({name: entry[field] for name, field in (('ETag', 'etag'), ('Link', 'link'))
+                                               if entry.get(field)})
+                cached = self._api_cache[key] = (entry['ts'], (200, entry['body'], headers))
+        if cached and not refresh and time.time() - cached[0] < ttl:
+            return cached[1]
+
+        headers = {}
+        etag = cached[1][2].get('ETag') if cached else None
+        if etag:
+            # A stale entry is revalidated; 304 replies are cheap and don't count against the rate limit
+            headers['If-None-Match'] = etag
+        response = self._gh_request('GET', url, token, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            result = cached[1]
+        else:
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+            result = (response.status_code, payload, response.headers)
+            if response.status_code != 200:
+                return result
+
+        self._api_cache[key] = (time.time(), result)
+        if persist:
+            # Link is kept so a page answered with 304 still knows where the next pages are
+            with self._disk_lock:
+                self._disk_api_cache()[disk_key] = {'ts': time.time(), 'etag': result[2].get('ETag'),
+                                                    'link': result[2].get('Link'), 'body': result[1]}
+                self._disk_dirty = True
+        return result
+
+    def _graphql(self, query, variables, token):
+        """POST a GraphQL query on the shared session and return (status, json)"""
+        response = self._gh_request('POST', GRAPHQL_URL, token, json={'query': query, 'variables': variables},
+                                    timeout=10)
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, None
+
+    def _repo_summary(self, owner, name, token):
+        """Return (status, {full_name, private, updated_at}) for a repository, fetching only those fields"""
+        disk_key = f"{hashlib.sha256(token.encode()).hexdigest()} {GRAPHQL_URL}"
+        if disk_key not in self._disk_api_cache():
+            status, payload = self._graphql(REPO_SUMMARY_QUERY, {'owner': owner, 'name': name}, token)
+            if status == 200 and payload and 'data' in payload:
+                repo = (payload['data'] or {}).get('repository')
+                if repo is None:
+                    return 404, None
+                return 200, {'full_name': repo['nameWithOwner'], 'private': repo['isPrivate'],
+                             'updated_at': repo['updatedAt']}
+            if status in (404, 410, 501):
+                # No GraphQL endpoint for this token/host; remember that and stay on REST
+                self._disk_api_cache()[disk_key] = {'ts': time.time(), 'etag': None, 'body': {'supported': False}}
+                self._save_disk_api_cache()
+
+        # REST fallback: re-checking a name within two minutes needs no request; after that a 304 revalidates it
+        status, repo_data, _ = self._gh_get(f'https://api.github.com/repos/{owner}/{name}', token,
+                                            ttl=120, persist=True)
+        self._flush_disk_api_cache()
+        return status, repo_data
+
+    def _iter_gh_pages(self, url, token, timeout=30):
+        """Yield each page of a paginated GitHub list endpoint, in order"""
+        import requests
+        from urllib.parse import parse_qsl, urlencode, urlsplit
+
+        def fetch(page_url):
+            # Pages are kept on disk between runs, so each is revalidated and an unchanged one comes back as a 304
+            status, payload, headers = self._gh_get(page_url, token, ttl=0, timeout=timeout, persist=True)
+            if status != 200:
+                message = payload.get('message', 'Request failed') if isinstance(payload, dict) else 'Request failed'
+                raise requests.exceptions.HTTPError(f"{status} {message}")
+            links = requests.utils.parse_header_links(headers.get('Link', ''))
+            return payload, {link.get('rel'): link['url'] for link in links}
+
+        try:
+            payload, links = fetch(url)
+            yield payload
+
+            # With rel="last" known, the remaining pages are independent and are fetched side by side
+            last = links.get('last')
+            last_page = dict(parse_qsl(urlsplit(last).query)).get('page', '') if last else ''
+            if 'next' in links and last_page.isdigit():
+                parts = urlsplit(last)
+                query = dict(parse_qsl(parts.query))
+                urls = [parts._replace(query=urlencode({**query, 'page': page})).geturl()
+                        for page in range(2, int(last_page) + 1)]
+                with ThreadPoolExecutor(max_workers=min(GH_MAX_WORKERS, len(urls))) as pool:
+                    for payload, _ in pool.map(fetch, urls):
+                        yield payload
+                return
+
+            while 'next' in links:
+                payload, links = fetch(links['next'])
+                yield payload
+        finally:
+            # One write for the whole listing instead of one per page
+            self._flush_disk_api_cache()
+
     def test_github_token_scopes(self, token, account_name):
         """Test token validity and get scopes"""
+        import requests
+
         try:
-            headers = {
-                'Authorization': f'Bearer {token}',
-                'Accept': 'application/vnd.github+json',
-                'User-Agent': 'GitGo-Python-Script'
-            }
+            status, user_info, response_headers = self._gh_get('https://api.github.com/user', token)
+            if status != 200:
+                message = (user_info or {}).get('message', 'Request failed')
+                raise requests.exceptions.HTTPError(f"{status} {message}")
             
-            response = requests.get('https://api.github.com/user', headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            user_info = response.json()
-            scopes = response.headers.get('X-OAuth-Scopes', '').split(', ') if response.headers.get('X-OAuth-Scopes') else []
+            scopes = response_headers.get('X-OAuth-Scopes', '').split(', ') if response_headers.get('X-OAuth-Scopes') else []
             
             print(f"✅ {account_name} token is valid")
             print(f"   → User: {user_info.get('login', 'N/A')}")
             print(f"   → Name: {user_info.get('name', 'N/A')}")
             print(f"   → Email: {user_info.get('email', 'N/A')}")
             print(f"   → Account Type: {user_info.get('type', 'N/A')}")
-            print(f"   → Rate Limit: {response.headers.get('X-RateLimit-Remaining', 'N/A')}/{response.headers.get('X-RateLimit-Limit', 'N/A')} remaining")
+            print(f"   → Rate Limit: {response_headers.get('X-RateLimit-Remaining', 'N/A')}/{response_headers.get('X-RateLimit-Limit', 'N/A')} remaining")
             
-            if response.headers.get('X-RateLimit-Reset'):
-                reset_time = datetime.fromtimestamp(int(response.headers['X-RateLimit-Reset']))
+            if response_headers.get('X-RateLimit-Reset'):
+                reset_time = datetime.fromtimestamp(int(response_headers['X-RateLimit-Reset']))
                 print(f"   → Reset Time: {reset_time.strftime('%Y-%m-%d %H:%M:%S')}")
             
             print("🔐 Token Scopes:")
@@ -511,6 +1101,39 @@ class GitGo:
             print(f"   → Error: {str(e)}")
             return False
 
+    def test_all_github_tokens(self):
+        """Validate the token of every configured account"""
+        print("\n🔐 GitHub Token Check (all accounts)")
+        print("──────────────────────────────────────────────")
+        if not self.accounts:
+            print("❌ No GitHub accounts found. Run 'python gitgo.py ssh-setup' to configure SSH keys.")
+            return
+
+        tokens = {}
+        for account in self.accounts:
+            try:
+                tokens[account['name']] = self.get_github_token(account)
+            except ValueError:
+                continue
+
+        # Query GitHub for every token at once, then report from the cache in account order
+        if len(tokens) > 1:
+            # Worker threads share the session, so its rate limiter and retries cover these calls
+            def prefetch(token):
+                try:
+                    self._gh_get('https://api.github.com/user', token)
+                except Exception:
+                    pass  # The report below retries and explains failures
+
+            # Build the lazy session here, not in several workers at once
+            self._ensure_http()
+            with ThreadPoolExecutor(max_workers=min(GH_MAX_WORKERS, len(tokens))) as pool:
+                list(pool.map(prefetch, tokens.values()))
+
+        for account_name, token in tokens.items():
+            print()
+            self.test_github_token_scopes(token, account_name)
+
     def get_valid_yes_no(self, prompt, default_value=None):
         """Validate yes/no input"""
         while True:
@@ -530,32 +1153,27 @@ class GitGo:
 
     def get_current_git_branch(self):
         """Get current Git branch"""
-        try:
-            result = subprocess.run(['git', 'branch', '--show-current'], 
-                                  capture_output=True, text=True, check=True)
-            branch = result.stdout.strip()
-            if not branch:
-                # Fallback for older Git versions or detached HEAD
-                result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], 
-                                      capture_output=True, text=True, check=True)
-                branch = result.stdout.strip()
-                if branch == "HEAD":
-                    return None  # Detached HEAD
-            return branch
-        except subprocess.CalledProcessError:
+        branch, _, returncode = self.run_git_command(['branch', '--show-current'], check=False)
+        if returncode != 0:
             return None
+        if not branch:
+            # Fallback for older Git versions or detached HEAD
+            branch, _, returncode = self.run_git_command(['rev-parse', '--abbrev-ref', 'HEAD'], check=False)
+            if returncode != 0 or branch == "HEAD":
+                return None  # Detached HEAD
+        return branch
 
     def get_default_branch(self):
         """Detect default branch"""
         try:
             # Try to get default branch from remote
             result = subprocess.run(['git', 'symbolic-ref', 'refs/remotes/origin/HEAD'], 
-                                  capture_output=True, text=True)
+                                  capture_output=True, text=True, **_NO_WINDOW)
             if result.returncode == 0:
                 return result.stdout.strip().replace('refs/remotes/origin/', '')
             
             # Fallback: check if main or master exists
-            result = subprocess.run(['git', 'branch', '-r'], capture_output=True, text=True)
+            result = subprocess.run(['git', 'branch', '-r'], capture_output=True, text=True, **_NO_WINDOW)
             if result.returncode == 0:
                 branches = result.stdout
                 if 'origin/main' in branches:
@@ -565,20 +1183,158 @@ class GitGo:
             
             # Last resort: assume main
             return "main"
-        except:
+        except (subprocess.CalledProcessError, OSError):
             return "main"
 
-    def run_git_command(self, cmd, check=True):
-        """Run git command and return result"""
+    def run_git_command(self, cmd, check=True, raw=False):
+        """Run git command and return result (raw=True returns unstripped bytes)"""
+        if not _is_read_only_git(cmd):
+            self._invalidate_git_cache()
+            return self._spawn_git(cmd, check, raw)
+
+        # Repeated read-only queries within a short window reuse the earlier result
+        key = (tuple(cmd), raw, os.getcwd())
+        result = self._cached_git_result(key)
+        if result is None:
+            result = None if raw else self._libgit_query(cmd)
+            if result is None:
+                result = self._spawn_git(cmd, check, raw)
+            self._remember_git_result(key, result)
+        return result
+
+    def run_git_queries(self, commands):
+        """Run independent read-only git queries concurrently, returning results in order"""
+        cwd = os.getcwd()
+        results = [self._cached_git_result((tuple(cmd), False, cwd)) or self._libgit_query(cmd)
+                   for cmd in commands]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            if sys.version_info >= (3, 8):
+                import asyncio
+                spawned = asyncio.run(_git_queries([commands[i] for i in pending]))
+            else:
+                spawned = [self._spawn_git(commands[i], False, False) for i in pending]
+            for i, result in zip(pending, spawned):
+                results[i] = result
+        for cmd, result in zip(commands, results):
+            self._remember_git_result((tuple(cmd), False, cwd), result)
+        return results
+
+    def _config_dict(self):
+        """Return the effective git config for the current directory as a dict"""
+        cwd = os.getcwd()
+        cached = self._config_cache.get(cwd)
+        if cached and time.monotonic() - cached[0] < GIT_CACHE_TTL:
+            return cached[1]
+        stdout, _, _ = self.run_git_command(['config', '--list', '-z'], check=False)
+        config = {}
+        for entry in stdout.split('\0'):
+            key, _, value = entry.partition('\n')
+            if key:
+                config[key] = value  # Later scopes override earlier ones, as in git
+        self._config_cache[cwd] = (time.monotonic(), config)
+        return config
+
+    def _porcelain_v2(self):
+        """Read branch, upstream and tracked changes in one git status call"""
+        stdout, _, returncode = self.run_git_command(
+            ['status', '--porcelain=v2', '--branch', '--untracked-files=no', '-z'], check=False, raw=True
+        )
+        if returncode != 0:
+            return RepoStatus(None, None, [])
+        branch = upstream = None
+        for record in stdout.split(b'\0'):
+            if record.startswith(b'# branch.head '):
+                branch = os.fsdecode(record[14:])
+            elif record.startswith(b'# branch.upstream '):
+                upstream = os.fsdecode(record[18:])
+        if branch == '(detached)':
+            branch = None
+        changes = [(xy.decode(), os.fsdecode(path)) for xy, path in _iter_porcelain_v2(stdout)]
+        return RepoStatus(branch, upstream, changes)
+
+    def _cached_git_result(self, key):
+        """Return a memoized git result that is still fresh, or None"""
+        cached = self._git_cache.get(key)
+        if cached and time.monotonic() - cached[0] < GIT_CACHE_TTL:
+            self._git_cache.move_to_end(key)
+            return cached[1]
+        return None
+
+    def _remember_git_result(self, key, result):
+        """Memoize a read-only git result, evicting the least recently used entry"""
+        self._git_cache[key] = (time.monotonic(), result)
+        self._git_cache.move_to_end(key)
+        if len(self._git_cache) > GIT_CACHE_SIZE:
+            self._git_cache.popitem(last=False)
+
+    def _libgit_query(self, cmd):
+        """Answer common read-only queries in-process with pygit2, or None to use git"""
+        repo = self._libgit_repo()
+        if repo is None:
+            return None
+        try:
+            if cmd == ['branch', '--show-current']:
+                head = repo.references['HEAD'].target
+                return ("" if repo.head_is_detached else head[len('refs/heads/'):]), "", 0
+            if cmd == ['rev-parse', '--short', 'HEAD'] and not repo.head_is_unborn:
+                return repo[repo.head.target].short_id, "", 0
+        except (pygit2.GitError, KeyError, ValueError):
+            pass
+        # Config stays on the CLI too: libgit2 ignores includeIf "hasconfig:remote.*.url:" includes,
+        # so it can report a different identity than git will commit as.
+        # Status, log and everything else stay on the CLI so output matches git byte for byte
+        return None
+
+    def _spawn_git(self, cmd, check, raw):
+        """Start a git process for run_git_command"""
         try:
-            result = subprocess.run(['git'] + cmd, capture_output=True, text=True, check=check)
+            # Writes such as push or commit may need a console for ssh or gpg prompts
+            no_window = _NO_WINDOW if _is_read_only_git(cmd) else {}
+            result = subprocess.run(['git'] + cmd, capture_output=True, text=not raw, check=check,
+                                    **no_window)
+            if raw:
+                return result.stdout, result.stderr, result.returncode
             return result.stdout.strip(), result.stderr.strip(), result.returncode
         except subprocess.CalledProcessError as e:
             return e.stdout, e.stderr, e.returncode
 
+    def _invalidate_git_cache(self):
+        """Forget memoized git query results after anything that may change the repository"""
+        self._git_cache.clear()
+        self._config_cache.clear()
+
+    def run_git_stdin(self, args, input_bytes):
+        """Run a git command that reads its input (such as a commit message) from stdin"""
+        self._invalidate_git_cache()
+        result = subprocess.run(['git', *args], input=input_bytes, capture_output=True)
+        return (result.stdout.decode(errors='replace').strip(), result.stderr.decode(errors='replace').strip(),
+                result.returncode)
+
+    def _branch_tip_hash(self, branch):
+        """Short hash of a branch tip, read in-process (pygit2, else its loose ref file) when possible"""
+        repo = self._libgit_repo()
+        if repo is not None:
+            try:
+                return repo[repo.references[f'refs/heads/{branch}'].resolve().target].short_id
+            except (pygit2.GitError, KeyError, ValueError):
+                pass
+        git_dir = _git_dir(os.getcwd()) if repo is None else None
+        if git_dir and branch:
+            try:
+                sha = Path(git_dir, 'refs', 'heads', branch).read_text().strip()
+                if len(sha) in (40, 64) and all(c in string.hexdigits for c in sha):
+                    return sha[:7]
+            except OSError:
+                pass  # Packed ref or linked worktree; let git resolve it
+        stdout, _, _ = self.run_git_command(['rev-parse', '--short', 'HEAD'], check=False)
+        return stdout
+
     def is_git_repo(self):
         """Check if current directory is a Git repository"""
-        return os.path.exists('.git')
+        if self._libgit_repo() is not None:
+            return True
+        return _git_dir(os.getcwd()) is not None
 
     def get_valid_account(self):
         """Get valid account selection"""
@@ -609,30 +1365,17 @@ class GitGo:
 
         # Show current status
         print("📊 Current repository status:")
-        stdout, stderr, returncode = self.run_git_command(['status', '--porcelain'], check=False)
+        stdout, stderr, returncode = self.run_git_command(['status', '--porcelain=v2', '-z'], check=False, raw=True)
         
         if not stdout:
             print("   ✅ Working tree clean - nothing to commit")
             return
         else:
             print("   📋 Changes detected:")
-            status_lines = [line for line in stdout.split('\n') if line.strip()]
-            for line in status_lines:
-                if len(line) >= 3:
-                    status = line[:2]
-                    file_name = line[3:]
-                    
-                    status_icons = {
-                        'M': '📝',   # Modified
-                        'A': '➕',   # Added
-                        'D': '🗑️',   # Deleted
-                        'R': '🔄',   # Renamed
-                        'C': '📋',   # Copied
-                        '??': '❓'   # Untracked
-                    }
-                    
-                    icon = status_icons.get(status.strip(), '📄')
-                    print(f"      {icon} {file_name}")
+            for status, file_name in _iter_porcelain_v2(stdout):
+                # '.' marks the unchanged side in v2; fall through to the worktree column
+                icon = STATUS_ICONS.get(chr(status[0] if status[0] != 0x2e else status[1]), '📄')
+                print(f"      {icon} {os.fsdecode(file_name)}")
 
         # Ask what to add
         print("\n🎯 What would you like to add?")
@@ -660,8 +1403,9 @@ class GitGo:
                 if files:
                     print("\n➕ Adding specified files...")
                     file_list = files.split()
-                    for file_name in file_list:
-                        self.run_git_command(['add', file_name])
+                    # One git call per batch; batches keep long lists under the OS argv limit
+                    for start in range(0, len(file_list), 500):
+                        self.run_git_command(['add', '--'] + file_list[start:start + 500])
                     add_action = "specified files"
                     valid_choice = True
                 else:
@@ -669,6 +1413,7 @@ class GitGo:
             elif add_choice == "4":
                 print("\n🎯 Starting interactive staging...")
                 subprocess.run(['git', 'add', '-p'])
+                self._invalidate_git_cache()
                 add_action = "interactive selection"
                 valid_choice = True
             else:
@@ -703,31 +1448,12 @@ class GitGo:
                     print("❌ Commit message cannot be empty.")
             elif msg_choice == "2":
                 print("\n📋 Available templates:")
-                templates = {
-                    "1": "feat: ",
-                    "2": "fix: ",
-                    "3": "docs: ",
-                    "4": "style: ",
-                    "5": "refactor: ",
-                    "6": "test: ",
-                    "7": "chore: "
-                }
-                
-                for key, value in templates.items():
-                    template_names = {
-                        "feat: ": "add new feature",
-                        "fix: ": "bug fix",
-                        "docs: ": "update documentation",
-                        "style: ": "formatting changes",
-                        "refactor: ": "code refactoring",
-                        "test: ": "add or update tests",
-                        "chore: ": "maintenance tasks"
-                    }
-                    print(f"   {key}. {value}{template_names[value]}")
+                sys.stdout.write("".join(f"   {i}. {prefix}{description}\n"
+                                         for i, (prefix, description) in enumerate(COMMIT_TEMPLATES, 1)))
                 
-                template_choice = safe_input("Select template (1-7): ").strip()
-                if template_choice in templates:
-                    template_prefix = templates[template_choice]
+                template_choice = safe_input(f"Select template (1-{len(COMMIT_TEMPLATES)}): ").strip()
+                if template_choice.isdecimal() and 1 <= int(template_choice) <= len(COMMIT_TEMPLATES):
+                    template_prefix = COMMIT_TEMPLATES[int(template_choice) - 1][0]
                     custom_part = safe_input(f"Complete the message: '{template_prefix}'").strip()
                     commit_msg = template_prefix + custom_part
                     valid_msg = True
@@ -736,6 +1462,7 @@ class GitGo:
             elif msg_choice == "3":
                 print("\n🔄 Amending previous commit...")
                 subprocess.run(['git', 'commit', '--amend'])
+                self._invalidate_git_cache()
                 print("✅ Commit amended successfully!")
                 
                 # Ask about pushing
@@ -750,23 +1477,26 @@ class GitGo:
         # Perform the commit
         print("\n💾 Committing changes...")
         try:
-            self.run_git_command(['commit', '-m', commit_msg])
+            # The message goes over stdin
+            current_branch = self.get_current_git_branch()
+            stdout, stderr, returncode = self.run_git_stdin(['commit', '--quiet', '--file=-'],
+                                                            commit_msg.encode('utf-8'))
+            if returncode != 0:
+                print(f"❌ Commit failed: {stderr or stdout}")
+                return
             print("✅ Commit successful!")
             print(f"   → Message: {commit_msg}")
             print(f"   → Added: {add_action}")
             
             # Show commit hash
-            commit_hash, _, _ = self.run_git_command(['rev-parse', '--short', 'HEAD'])
-            print(f"   → Commit hash: {commit_hash}")
+            print(f"   → Commit hash: {self._branch_tip_hash(current_branch)}")
 
             # Ask about pushing
-            current_branch = self.get_current_git_branch()
             if current_branch:
                 should_push = self.get_valid_yes_no(f"🚀 Push commit to origin/{current_branch}?")
                 if should_push:
                     # Check if upstream is set
-                    _, _, returncode = self.run_git_command(['rev-parse', '--abbrev-ref', f'{current_branch}@{{upstream}}'], check=False)
-                    if returncode != 0:
+                    if f'branch.{current_branch}.merge' not in self._config_dict():
                         print("🔗 Setting upstream and pushing...")
                         self.run_git_command(['push', '-u', 'origin', current_branch])
                     else:
@@ -807,12 +1537,13 @@ class GitGo:
         print(f"\n📋 Last {num_commits} commits:\n")
 
         try:
-            stdout, stderr, returncode = self.run_git_command(['log', '--oneline', '--graph', '--decorate', f'-n{num_commits}'], check=False)
+            # At most 50 lines, so emit the whole graph with a single write
+            stdout, _, returncode = self.run_git_command(
+                ['log', '--oneline', '--graph', '--decorate', f'-n{num_commits}'], check=False
+            )
             if returncode == 0 and stdout:
-                for line in stdout.split('\n'):
-                    if line.strip():
-                        print(f"   {line}")
-                
+                sys.stdout.write("".join(f"   {line}\n" for line in stdout.splitlines()))
+
                 print("\n🔍 View options:")
                 print("   1. Show detailed commit info")
                 print("   2. Show file changes for a specific commit")
@@ -855,6 +1586,13 @@ class GitGo:
         print(f"📁 Repository: {repo_name}")
 
         try:
+            # The remaining probes are independent, so they run side by side
+            (git_name, _, _), (git_email, _, _), (remotes, _, remotes_code), \
+                (status_output, _, _), (commit_output, _, log_code) = self.run_git_queries([
+                    ['config', 'user.name'], ['config', 'user.email'], ['remote', '-v'],
+                    ['status', '--porcelain=v2', '-z'], ['log', '--oneline', '-3'],
+                ])
+
             # Current branch
             current_branch = self.get_current_git_branch()
             if current_branch:
@@ -863,55 +1601,34 @@ class GitGo:
                 print("🌿 Current Branch: (detached HEAD or no commits)")
 
             # Git identity
-            git_name, _, _ = self.run_git_command(['config', 'user.name'], check=False)
-            git_email, _, _ = self.run_git_command(['config', 'user.email'], check=False)
             print("👤 Git Identity:")
             print(f"   → Name: {git_name if git_name else '(not configured)'}")
             print(f"   → Email: {git_email if git_email else '(not configured)'}")
 
             # Remote URLs
-            remotes, _, returncode = self.run_git_command(['remote', '-v'], check=False)
-            if returncode == 0 and remotes:
+            if remotes_code == 0 and remotes:
                 print("🔗 Remote URLs:")
-                for line in remotes.split('\n'):
-                    if line.strip():
-                        print(f"   → {line}")
+                sys.stdout.write("".join(f"   → {line}\n" for line in remotes.splitlines() if line.strip()))
             else:
                 print("🔗 Remote URLs: (no remotes configured)")
 
             # Working tree status
             print("📈 Repository Status:")
-            status_output, _, _ = self.run_git_command(['status', '--porcelain'], check=False)
-            if not status_output:
+            # v2 -z records start with their type and mark unchanged sides with '.', so nothing leading is lost
+            changes = [(xy.decode(), os.fsdecode(path)) for xy, path in _iter_porcelain_v2(status_output.encode())]
+            if not changes:
                 print("   ✅ Working tree clean")
             else:
                 print("   ⚠️ Working tree has changes:")
-                status_lines = [line for line in status_output.split('\n') if line.strip()]
-                for line in status_lines:
-                    if len(line) >= 3:
-                        status = line[:2]
-                        file_name = line[3:]
-                        
-                        status_icons = {
-                            'M': '📝',   # Modified
-                            'A': '➕',   # Added
-                            'D': '🗑️',   # Deleted
-                            'R': '🔄',   # Renamed
-                            'C': '📋',   # Copied
-                            '??': '❓'   # Untracked
-                        }
-                        
-                        icon = status_icons.get(status.strip(), '📄')
-                        print(f"      {icon} {file_name}")
+                sys.stdout.write("".join(
+                    f"      {STATUS_ICONS.get(xy[0] if xy[0] != '.' else xy[1], '📄')} {path}\n"
+                    for xy, path in changes
+                ))
 
             # Recent commits (last 3)
             print("📚 Recent Commits (last 3):")
-            commit_output, _, returncode = self.run_git_command(['log', '--oneline', '-3'], check=False)
-            if returncode == 0 and commit_output:
-                commits = [line for line in commit_output.split('\n') if line.strip()]
-                for commit in commits:
-                    if commit.strip():
-                        print(f"   → {commit}")
+            if log_code == 0 and commit_output:
+                sys.stdout.write("".join(f"   → {commit}\n" for commit in commit_output.splitlines() if commit.strip()))
             else:
                 print("   (no commits found)")
 
@@ -922,19 +1639,25 @@ class GitGo:
     def display_actions_menu(self):
         """Display the main actions menu"""
         print("\n🛠️ Available Actions:\n")
-        
-        # Display actions in 3 columns
+        sys.stdout.write(self._menu_str)
+
+    def _format_actions_menu(self):
+        """Lay the actions out in 3 columns, one line per row"""
         column_width = 22
         columns = 3
         action_list = [f"{i+1}. {action}" for i, action in enumerate(self.valid_actions)]
         
+        rows = []
         for i in range(0, len(action_list), columns):
             row = action_list[i:i+columns]
             formatted_row = [item.ljust(column_width) for item in row]
-            print("   " + "".join(formatted_row))
+            rows.append("   " + "".join(formatted_row) + "\n")
+        return "".join(rows)
 
-    print("\nType the action name or number. Type 'q' to quit.")
-    print("\nFirst time? Run 'setup' (13) to configure GitHub accounts and tokens securely.")
+    def print_startup_hint(self):
+        """Explain how to pick an action, pointing first-time users at setup"""
+        print("\nType the action name or number. Type 'q' to quit.")
+        print(f"\nFirst time? Run 'setup' ({self.valid_actions.index('setup') + 1}) to configure GitHub accounts and tokens securely.")
 
     def get_action_input(self):
         """Get and validate action input"""
@@ -954,14 +1677,24 @@ class GitGo:
             print("\n👋 Exiting GitGo. Goodbye!")
             sys.exit(0)
 
+    def _clone_command(self, remote_url):
+        """Build the git clone command, offering a shallow clone of the default branch"""
+        # Submodules, if any, are fetched in parallel
+        clone_cmd = ['git', 'clone', '--recurse-submodules', f'--jobs={os.cpu_count() or 4}']
+        if self.get_valid_yes_no("Perform a shallow (depth=1) clone? (faster for fresh work)", "y"):
+            print("   → Run 'git fetch --unshallow' later if you need the full history")
+            clone_cmd += ['--depth=1', '--filter=blob:none', '--single-branch', '--no-tags']
+        return clone_cmd + [remote_url]
+
     def handle_clone(self, github_user, ssh_alias, git_email):
         """Handle repository cloning"""
         repo_name = safe_input("Enter the repository name to clone: ").strip()
         remote_url = f"git@{ssh_alias}:{github_user}/{repo_name}.git"
 
+        clone_cmd = self._clone_command(remote_url)
         print(f"\n🔍 Cloning from: {remote_url}")
         try:
-            result = subprocess.run(['git', 'clone', remote_url], capture_output=True, text=True, check=True)
+            result = subprocess.run(clone_cmd, capture_output=True, text=True, check=True)
             print(result.stdout)
             if result.stderr:
                 print(result.stderr)
@@ -969,27 +1702,22 @@ class GitGo:
             if os.path.exists(repo_name):
                 os.chdir(repo_name)
                 # Check if Git username is already configured locally
-                existing_name, _, name_returncode = self.run_git_command(['config', 'user.name'], check=False)
-                existing_email, _, email_returncode = self.run_git_command(['config', 'user.email'], check=False)
+                config = self._config_dict()
+                existing_name = config.get('user.name', '')
+                existing_email = config.get('user.email', '')
 
                 # Get localGitUser from account config if available
-                local_git_user = None
-                for acc in self.accounts:
-                    if acc.get('sshAlias') == ssh_alias:
-                        local_git_user = acc.get('localGitUser', github_user)
-                        break
-                if not local_git_user:
-                    local_git_user = github_user
+                local_git_user = self._accounts_by_alias.get(ssh_alias, {}).get('localGitUser') or github_user
 
                 # Set user.email if not set
-                if email_returncode != 0 or not existing_email.strip():
+                if not existing_email.strip():
                     self.run_git_command(['config', 'user.email', git_email])
                     configured_email = git_email
                 else:
                     configured_email = existing_email.strip()
 
                 # Set user.name if not set: auto-configure from config file (no prompt)
-                if name_returncode != 0 or not existing_name.strip():
+                if not existing_name.strip():
                     self.run_git_command(['config', 'user.name', local_git_user])
                     configured_name = local_git_user
                 else:
@@ -1011,21 +1739,25 @@ class GitGo:
             print("\n❌ Not a Git repository. Initialize with 'git init' first.")
             return
 
-        current_branch = self.get_current_git_branch()
+        repo_status = self._porcelain_v2()
+        current_branch = repo_status.branch
         if not current_branch:
             print("\n❌ Unable to determine current branch. You may be in a detached HEAD state.")
             return
 
         print(f"\n🚀 Preparing to push from branch: {current_branch}")
 
+        # Identity and remotes all come from one config listing taken before changing anything
+        config = self._config_dict()
+        origin_url = config.get('remote.origin.url', '')
+        existing_name = config.get('user.name', '')
+        existing_email = config.get('user.email', '')
+
         # Check for uncommitted changes
-        status_output, _, _ = self.run_git_command(['status', '--porcelain'], check=False)
-        if status_output:
+        if repo_status.changes:
             print("⚠️ You have uncommitted changes:")
-            status_lines = [line for line in status_output.split('\n') if line.strip()][:5]
-            for line in status_lines:
-                if len(line) >= 3:
-                    print(f"   → {line[3:]}")
+            for _, file_name in repo_status.changes[:5]:
+                print(f"   → {file_name}")
             
             should_continue = self.get_valid_yes_no("Continue pushing without committing these changes?")
             if not should_continue:
@@ -1034,14 +1766,10 @@ class GitGo:
 
         # Ask for repository name (with auto-detection option)
         detected_repo = None
-        try:
-            remote_url, _, returncode = self.run_git_command(['config', '--get', 'remote.origin.url'], check=False)
-            if returncode == 0 and remote_url:
-                match = re.search(r'/([^/]+?)(?:\.git)?$', remote_url)
-                if match:
-                    detected_repo = match.group(1)
-        except:
-            pass
+        if '/' in origin_url:
+            detected_repo = origin_url.rstrip('/').rsplit('/', 1)[-1]
+            if detected_repo.endswith('.git'):
+                detected_repo = detected_repo[:-4]
 
         if detected_repo:
             use_detected = self.get_valid_yes_no(f"Use detected repository name '{detected_repo}'?", "y")
@@ -1055,50 +1783,44 @@ class GitGo:
         remote_url = f"git@{ssh_alias}:{github_user}/{repo_name}.git"
 
         # Check if Git username is already configured locally
-        existing_name, _, name_returncode = self.run_git_command(['config', 'user.name'], check=False)
-        if name_returncode != 0 or not existing_name.strip():
+        if not existing_name.strip():
             self.run_git_command(['config', 'user.name', github_user])
             configured_name = github_user
         else:
             configured_name = existing_name.strip()
         
         # Check if Git email is already configured locally
-        existing_email, _, email_returncode = self.run_git_command(['config', 'user.email'], check=False)
-        if email_returncode != 0 or not existing_email.strip():
+        if not existing_email.strip():
             self.run_git_command(['config', 'user.email', git_email])
             configured_email = git_email
         else:
             configured_email = existing_email.strip()
 
         # Handle remote setup
-        remotes, _, _ = self.run_git_command(['remote'], check=False)
-        if 'origin' not in remotes:
+        if 'remote.origin.url' not in config:
             self.run_git_command(['remote', 'add', 'origin', remote_url])
             print(f"\n🔗 Remote 'origin' added: {remote_url}")
         else:
             # Check if remote URL matches
-            existing_url, _, _ = self.run_git_command(['config', '--get', 'remote.origin.url'], check=False)
-            if existing_url != remote_url:
+            if origin_url != remote_url:
                 self.run_git_command(['remote', 'set-url', 'origin', remote_url])
                 print(f"\n🔄 Remote 'origin' updated: {remote_url}")
 
         # Check if upstream is set for current branch
-        _, _, returncode = self.run_git_command(['rev-parse', '--abbrev-ref', f'{current_branch}@{{upstream}}'], check=False)
-        upstream_exists = returncode == 0
+        upstream_exists = repo_status.upstream is not None
         
         print(f"\n🚀 Pushing branch '{current_branch}'...")
         try:
-            if not upstream_exists:
-                print("🔗 Setting upstream and pushing...")
-                result = subprocess.run(['git', 'push', '-u', 'origin', current_branch], 
-                                      capture_output=True, text=True, check=True)
-            else:
-                result = subprocess.run(['git', 'push', 'origin', current_branch], 
-                                      capture_output=True, text=True, check=True)
-            
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
+            # git writes its progress and errors straight to the terminal
+            try:
+                if not upstream_exists:
+                    print("🔗 Setting upstream and pushing...")
+                    subprocess.run(['git', 'push', '-u', 'origin', current_branch], check=True)
+                else:
+                    subprocess.run(['git', 'push', 'origin', current_branch], check=True)
+            finally:
+                # A failed push may still have written upstream config or remote-tracking refs
+                self._invalidate_git_cache()
 
             print(f"\n✅ Push complete using '{account}' identity:")
             print(f"  → Repo: {repo_name}")
@@ -1107,8 +1829,7 @@ class GitGo:
             print(f"  → Git user.name: {configured_name}")
             print(f"  → Git user.email: {configured_email}")
         except subprocess.CalledProcessError as e:
-            print("\n❌ Error during push:")
-            print(e.stderr if e.stderr else str(e))
+            print(f"\n❌ Error during push (git exited with {e.returncode}). Check the output above.")
 
     def handle_pull(self):
         """Handle repository pulling"""
@@ -1118,21 +1839,19 @@ class GitGo:
             print("   → Make sure you're inside a valid Git repo before pulling.")
             return
 
-        current_branch = self.get_current_git_branch()
+        repo_status = self._porcelain_v2()
+        current_branch = repo_status.branch
         if not current_branch:
             print("\n❌ Unable to determine current branch. You may be in a detached HEAD state.")
             return
 
         # Check for uncommitted changes
-        status_output, _, _ = self.run_git_command(['status', '--porcelain'], check=False)
         should_pop_stash = False
         
-        if status_output:
+        if repo_status.changes:
             print("⚠️ You have uncommitted changes:")
-            status_lines = [line for line in status_output.split('\n') if line.strip()][:5]
-            for line in status_lines:
-                if len(line) >= 3:
-                    print(f"   → {line[3:]}")
+            for _, file_name in repo_status.changes[:5]:
+                print(f"   → {file_name}")
             
             print("\n🎯 Options:")
             print("   1. Stash changes and pull")
@@ -1161,31 +1880,29 @@ class GitGo:
         print(f"\n📥 Pulling latest changes from origin/{current_branch}...")
         try:
             # Check if upstream is set
-            _, _, returncode = self.run_git_command(['rev-parse', '--abbrev-ref', f'{current_branch}@{{upstream}}'], check=False)
-            upstream_exists = returncode == 0
-            
-            if not upstream_exists:
-                print(f"🔗 No upstream set. Trying to pull from origin/{current_branch}...")
-                result = subprocess.run(['git', 'pull', 'origin', current_branch], 
-                                      capture_output=True, text=True, check=True)
-            else:
-                result = subprocess.run(['git', 'pull'], capture_output=True, text=True, check=True)
+            upstream_exists = repo_status.upstream is not None
             
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
+            # git writes its progress and errors straight to the terminal
+            try:
+                if not upstream_exists:
+                    print(f"🔗 No upstream set. Trying to pull from origin/{current_branch}...")
+                    subprocess.run(['git', 'pull', 'origin', current_branch], check=True)
+                else:
+                    subprocess.run(['git', 'pull'], check=True)
+            finally:
+                self._invalidate_git_cache()
 
             print("\n✅ Pull complete. Local repo updated with remote changes.")
             
             # Pop stash if we stashed changes
             if should_pop_stash:
                 print("\n📦 Restoring stashed changes...")
-                result = subprocess.run(['git', 'stash', 'pop'], capture_output=True, text=True)
-                if result.returncode == 0:
+                returncode = subprocess.run(['git', 'stash', 'pop']).returncode
+                self._invalidate_git_cache()
+                if returncode == 0:
                     print("✅ Stashed changes restored successfully.")
                 else:
-                    print("⚠️ Conflict while restoring stash:")
-                    print(result.stderr)
+                    print("⚠️ Conflict while restoring stash (see git's output above)")
                     print("   → Resolve conflicts manually and run 'git stash drop' when done")
                     
         except subprocess.CalledProcessError as e:
@@ -1195,30 +1912,27 @@ class GitGo:
 
     def handle_remotelist(self, token, github_user):
         """List repositories under GitHub account"""
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'User-Agent': 'GitGo-Python-Script'
-        }
+        import requests
 
         api_url = 'https://api.github.com/user/repos?per_page=100&sort=updated'
 
         print(f"\n📦 Fetching repositories for '{github_user}'...")
         try:
-            response = requests.get(api_url, headers=headers, timeout=30)
-            response.raise_for_status()
-            repos = response.json()
-            
-            if len(repos) == 0:
+            total = 0
+            for repos in self._iter_gh_pages(api_url, token):
+                if not total and repos:
+                    print(f"\n📚 Repositories under '{github_user}' (sorted by last updated):\n")
+                # Print each page as it arrives instead of after the whole listing
+                for repo in repos:
+                    total += 1
+                    visibility = "🔒 private" if repo['private'] else "🌐 public"
+                    last_updated = repo['updated_at'][:10]  # ISO 8601 already starts with YYYY-MM-DD
+                    print(f"  {total}. {repo['name']}  [{visibility}] (updated: {last_updated})")
+
+            if total == 0:
                 print(f"\n📭 No repositories found under '{github_user}'.")
             else:
-                print(f"\n📚 Repositories under '{github_user}' (sorted by last updated):\n")
-                for index, repo in enumerate(repos, 1):
-                    visibility = "🔒 private" if repo['private'] else "🌐 public"
-                    last_updated = datetime.fromisoformat(repo['updated_at'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-                    print(f"  {index}. {repo['name']}  [{visibility}] (updated: {last_updated})")
-                
-                print(f"\n📊 Total repositories: {len(repos)}")
+                print(f"\n📊 Total repositories: {total}")
                 
         except requests.exceptions.RequestException as e:
             print("\n❌ Failed to fetch repositories:")
@@ -1228,32 +1942,27 @@ class GitGo:
 
     def handle_addremote(self, account, token, github_user, ssh_alias, git_email):
         """Create a new GitHub repository"""
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'User-Agent': 'GitGo-Python-Script'
-        }
+        import requests
 
         name_taken = True
         while name_taken:
             repo_name = safe_input("Enter the repository name (e.g., habit_flow_app): ").strip()
             # Validate repository name format
-            if re.match(r'^[a-zA-Z0-9._-]+$', repo_name) and len(repo_name) <= 100:
-                check_url = f'https://api.github.com/repos/{github_user}/{repo_name}'
+            if _REPO_NAME_RE.match(repo_name):
                 try:
-                    response = requests.get(check_url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        print(f"\n🚫 A repository named '{repo_name}' already exists under '{github_user}'. Please choose a different name.")
-                        name_taken = True
-                    elif response.status_code == 404:
-                        print(f"\n✅ Repo name '{repo_name}' is available.")
-                        name_taken = False
-                    else:
-                        print(f"\n❌ Error checking repository availability: {response.status_code}")
-                        name_taken = True
+                    status = self._repo_status(github_user, repo_name, token)
                 except requests.exceptions.RequestException as e:
                     print(f"\n❌ Error checking repository availability: {str(e)}")
-                    name_taken = True
+                    continue
+                if status not in (200, 404):
+                    print(f"\n❌ Error checking repository availability: {status}")
+                    continue
+
+                if status == 200:
+                    print(f"\n🚫 A repository named '{repo_name}' already exists under '{github_user}'. Please choose a different name.")
+                else:
+                    print(f"\n✅ Repo name '{repo_name}' is available.")
+                    name_taken = False
             else:
                 print("\n❌ Invalid repository name. Use only letters, numbers, dots, hyphens, and underscores (max 100 chars).")
 
@@ -1270,10 +1979,11 @@ class GitGo:
         print("\n🌐 Creating remote repository on GitHub with README...")
         print(f"🔑 Using {account} account token")
         try:
-            response = requests.post('https://api.github.com/user/repos', 
-                                   headers=headers, json=body, timeout=30)
+            response = self._gh_request('POST', 'https://api.github.com/user/repos', token,
+                                        json=body, timeout=30)
             response.raise_for_status()
             repo_data = response.json()
+            self._set_repo_status(github_user, repo_name, token, 200)
             print("\n✅ Remote repository created:")
             print(f"  → Name: {repo_data['name']}")
             print(f"  → URL: {repo_data['html_url']}")
@@ -1283,10 +1993,10 @@ class GitGo:
             should_clone = self.get_valid_yes_no("🧲 Clone repo to current directory?")
             if should_clone:
                 alias_url = f"git@{ssh_alias}:{github_user}/{repo_name}.git"
+                clone_cmd = self._clone_command(alias_url)
                 print(f"\n🔍 Cloning from: {alias_url}")
                 try:
-                    result = subprocess.run(['git', 'clone', alias_url], 
-                                          capture_output=True, text=True, check=True)
+                    result = subprocess.run(clone_cmd, capture_output=True, text=True, check=True)
                     print("\n📦 Cloning...")
                     print(result.stdout)
                     if result.stderr:
@@ -1295,16 +2005,17 @@ class GitGo:
                     if os.path.exists(repo_name):
                         os.chdir(repo_name)
                         # Check if Git username is already configured locally
-                        existing_name, _, name_returncode = self.run_git_command(['config', 'user.name'], check=False)
-                        if name_returncode != 0 or not existing_name.strip():
+                        config = self._config_dict()
+                        existing_name = config.get('user.name', '')
+                        if not existing_name.strip():
                             self.run_git_command(['config', 'user.name', github_user])
                             configured_name = github_user
                         else:
                             configured_name = existing_name.strip()
                         
                         # Check if Git email is already configured locally
-                        existing_email, _, email_returncode = self.run_git_command(['config', 'user.email'], check=False)
-                        if email_returncode != 0 or not existing_email.strip():
+                        existing_email = config.get('user.email', '')
+                        if not existing_email.strip():
                             self.run_git_command(['config', 'user.email', git_email])
                             configured_email = git_email
                         else:
@@ -1331,32 +2042,34 @@ class GitGo:
 
     def handle_delremote(self, account, token, github_user):
         """Delete a GitHub repository"""
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'User-Agent': 'GitGo-Python-Script'
-        }
+        import requests
 
         name_valid = False
         while not name_valid:
             repo_name = safe_input("Enter the name of the repository to delete: ").strip()
+            # Names GitHub would never accept fail here, without spending a request
+            if not _REPO_NAME_RE.match(repo_name):
+                print("\n❌ Invalid repository name. Use only letters, numbers, dots, hyphens, and underscores (max 100 chars).")
+                continue
             check_url = f'https://api.github.com/repos/{github_user}/{repo_name}'
 
             try:
-                response = requests.get(check_url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    repo_data = response.json()
+                # Typing the same wrong name again within REPO_STATUS_TTL needs no request
+                status = self._repo_status(github_user, repo_name, token)
+                if status == 200:
                     print(f"\n⚠️ Repo '{repo_name}' found under '{github_user}'.")
-                    print("   Repository details:")
-                    print(f"   → Full name: {repo_data['full_name']}")
-                    print(f"   → Visibility: {'Private' if repo_data['private'] else 'Public'}")
-                    updated_at = datetime.fromisoformat(repo_data['updated_at'].replace('Z', '+00:00'))
-                    print(f"   → Last updated: {updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
                     name_valid = True
-                elif response.status_code == 404:
+                    status, repo_data = self._repo_summary(github_user, repo_name, token)
+                    if status == 200:
+                        print("   Repository details:")
+                        print(f"   → Full name: {repo_data['full_name']}")
+                        print(f"   → Visibility: {'Private' if repo_data['private'] else 'Public'}")
+                        updated_at = _parse_gh_ts(repo_data['updated_at'])
+                        print(f"   → Last updated: {updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+                elif status == 404:
                     print(f"\n🚫 Repo '{repo_name}' not found under '{github_user}'. Please enter a valid name.")
                 else:
-                    print(f"\n❌ Error accessing repository: {response.status_code}")
+                    print(f"\n❌ Error accessing repository: {status}")
             except requests.exceptions.RequestException as e:
                 print(f"\n❌ Error accessing repository: {str(e)}")
 
@@ -1368,8 +2081,10 @@ class GitGo:
         should_delete = self.get_valid_yes_no(f"Are you absolutely sure you want to delete '{repo_name}'?")
         if should_delete:
             try:
-                response = requests.delete(check_url, headers=headers, timeout=30)
+                response = self._gh_request('DELETE', check_url, token, timeout=30)
                 response.raise_for_status()
+                self._forget_api_response(check_url, token)
+                self._set_repo_status(github_user, repo_name, token, 404)
                 print(f"\n🗑️ Repository '{repo_name}' has been permanently deleted.")
                 print(f"   → The repository name '{repo_name}' is now available for reuse")
             except requests.exceptions.RequestException as e:
@@ -1386,13 +2101,14 @@ class GitGo:
         if not is_git_repo:
             print("\n🧱 No Git repo detected. Initializing...")
             self.run_git_command(['init'])
+            _git_dir.cache_clear()
+            self._repo_cwd = None
             print("✅ Git repository initialized.")
 
         custom_name = safe_input("Enter the Git username to set: ").strip()
         custom_email = safe_input("Enter the Git email to set: ").strip()
         # Validate email format
-        email_pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-        if re.match(email_pattern, custom_email):
+        if _EMAIL_RE.match(custom_email):
             self.run_git_command(['config', 'user.name', custom_name])
             self.run_git_command(['config', 'user.email', custom_email])
             print("\n✅ Git identity configured for this repository:")
@@ -1403,15 +2119,30 @@ class GitGo:
 
     def handle_showuser(self):
         """Display current Git identity"""
-        current_name, _, _ = self.run_git_command(['config', 'user.name'], check=False)
-        current_email, _, _ = self.run_git_command(['config', 'user.email'], check=False)
-        global_name, _, _ = self.run_git_command(['config', '--global', 'user.name'], check=False)
-        global_email, _, _ = self.run_git_command(['config', '--global', 'user.email'], check=False)
+        # Read every scope in one call instead of four separate `git config` lookups
+        config_output, _, _ = self.run_git_command(['config', '--list', '--show-scope', '-z'], check=False)
+        scoped = {}
+        effective = {}
+        # With -z each row is "scope\0key\nvalue\0"
+        fields = config_output.split('\0')
+        for scope, entry in zip(fields[0::2], fields[1::2]):
+            key, _, value = entry.partition('\n')
+            scoped[(scope, key)] = value
+            # Scopes are listed lowest precedence first, so the last value wins
+            effective[key] = value
+
+        current_name = effective.get('user.name')
+        current_email = effective.get('user.email')
+        global_name = scoped.get(('global', 'user.name'))
+        global_email = scoped.get(('global', 'user.email'))
+        # Every repository has local-scope entries (core.repositoryformatversion at least),
+        # so the same listing also tells whether we are inside one
+        in_repo = any(scope == 'local' for scope, _ in scoped)
 
         print("\n👤 Git Identity Configuration:")
         print("──────────────────────────────────────────────")
         
-        if self.is_git_repo():
+        if in_repo:
             print("📁 Current Repository:")
             print(f"  → Name: {current_name if current_name else '(not set)'}")
             print(f"  → Email: {current_email if current_email else '(not set)'}")
@@ -1424,18 +2155,18 @@ class GitGo:
 
     def add_gitgo_to_env(self):
         """Add the current script directory to the Windows PATH environment variable (user scope)"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        import winreg
+        script_dir = _SCRIPT_DIR
+        if winreg is None:
+            print("❌ PATH setup uses the Windows registry and is only available on Windows.")
+            return
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_ALL_ACCESS) as key:
-                try:
-                    current_path, _ = winreg.QueryValueEx(key, 'Path')
-                except FileNotFoundError:
-                    current_path = ''
-                if script_dir not in current_path.split(';'):
-                    new_path = current_path + (';' if current_path and not current_path.endswith(';') else '') + script_dir
-                    winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path)
-                    print(f"✅ Added '{script_dir}' to user PATH. Restart your terminal to use 'gitgo' anywhere.")
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_READ | winreg.KEY_SET_VALUE) as key:
+                paths, normalized = _load_user_path(key)
+                if os.path.normcase(script_dir) not in normalized:
+                    paths.append(script_dir)
+                    winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, ';'.join(paths))
+                    _broadcast_environment_change()
+                    print(f"✅ Added '{script_dir}' to user PATH. Open a new terminal to use 'gitgo' anywhere.")
                 else:
                     print(f"ℹ️ '{script_dir}' is already in your user PATH.")
         except Exception as e:
@@ -1443,18 +2174,21 @@ class GitGo:
 
     def remove_gitgo_from_env(self):
         """Remove the script directory from the Windows PATH environment variable (user scope)"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        import winreg
+        script_dir = _SCRIPT_DIR
+        if winreg is None:
+            print("❌ PATH setup uses the Windows registry and is only available on Windows.")
+            return
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_ALL_ACCESS) as key:
-                try:
-                    current_path, _ = winreg.QueryValueEx(key, 'Path')
-                except FileNotFoundError:
-                    current_path = ''
-                paths = [p for p in current_path.split(';') if p and os.path.normcase(p) != os.path.normcase(script_dir)]
-                new_path = ';'.join(paths)
-                winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path)
-                print(f"✅ Removed '{script_dir}' from user PATH. Restart your terminal for changes to take effect.")
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Environment', 0, winreg.KEY_READ | winreg.KEY_SET_VALUE) as key:
+                paths, normalized = _load_user_path(key)
+                target = os.path.normcase(script_dir)
+                if target in normalized:
+                    paths = [p for p in paths if os.path.normcase(p) != target]
+                    winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, ';'.join(paths))
+                    _broadcast_environment_change()
+                    print(f"✅ Removed '{script_dir}' from user PATH. Open a new terminal for changes to take effect.")
+                else:
+                    print(f"ℹ️ '{script_dir}' is not in your user PATH.")
         except Exception as e:
             print(f"❌ Failed to remove from PATH: {e}")
 
@@ -1468,8 +2202,9 @@ class GitGo:
                 print("2. Configure your token for accounts")
                 print("3. Add GitGo to Windows environment variable (PATH)")
                 print("4. Remove GitGo from Windows environment variable (PATH)")
-                print("5. Exit setup menu")
-                choice = input("\nEnter your choice (1-5): ").strip()
+                print("5. Check tokens for all accounts")
+                print("6. Exit setup menu")
+                choice = input("\nEnter your choice (1-6): ").strip()
                 if choice == "1":
                     generate_github_ssh_keys_and_config()
                 elif choice == "2":
@@ -1479,13 +2214,41 @@ class GitGo:
                 elif choice == "4":
                     self.remove_gitgo_from_env()
                 elif choice == "5":
+                    self.test_all_github_tokens()
+                elif choice == "6":
                     print("Exiting setup menu.")
                     break
                 else:
-                    print("❌ Invalid choice. Please enter 1, 2, 3, 4, or 5.")
+                    print("❌ Invalid choice. Please enter 1, 2, 3, 4, 5, or 6.")
         except KeyboardInterrupt:
             print("\n👋 Exiting setup menu. Goodbye!")
 
+    def handle_tokeninfo(self, account, token):
+        """Show validity, scopes and rate limit for the selected account's token"""
+        print("\n🔐 GitHub Token Information")
+        print("──────────────────────────────────────────────")
+        self.test_github_token_scopes(token, account)
+
+    # Menu action -> (handler, account context arguments it takes, in order)
+    ACTIONS = {
+        "clone": (handle_clone, ('github_user', 'ssh_alias', 'git_email')),
+        "push": (handle_push, ('account', 'github_user', 'ssh_alias', 'git_email')),
+        "pull": (handle_pull, ()),
+        "adduser": (handle_adduser, ()),
+        "showuser": (handle_showuser, ()),
+        "addremote": (handle_addremote, ('account', 'token', 'github_user', 'ssh_alias', 'git_email')),
+        "delremote": (handle_delremote, ('account', 'token', 'github_user')),
+        "remotelist": (handle_remotelist, ('token', 'github_user')),
+        "status": (get_git_repository_info, ()),
+        "commit": (invoke_git_commit, ()),
+        "history": (show_git_history, ()),
+        "tokeninfo": (handle_tokeninfo, ('account', 'token')),
+        "setup": (setup_menu, ()),
+        "branch": (handle_branch, ()),
+        "changename": (handle_changename, ('account', 'token', 'github_user')),
+        "help": (handle_help, ()),
+    }
+
     def run(self):
         """Main application runner"""
         if len(sys.argv) > 1:
@@ -1501,75 +2264,42 @@ class GitGo:
 
         # Display main menu
         self.display_actions_menu()
+        self.print_startup_hint()
 
         # Get action from user
         action = self.get_action_input()
 
-        # Handle account setup for relevant actions
-        if action in ["clone", "push", "addremote", "delremote", "remotelist", "tokeninfo"]:
+        handler, arg_names = self.ACTIONS.get(action, (None, ()))
+        if handler is None:
+            print("\n❌ Invalid action. Please enter one of the following:")
+            print("   → " + " / ".join(name for name in self.valid_actions if name in self.ACTIONS))
+            return
+
+        # Actions that take arguments act for a GitHub account, so select it and its token first
+        context = {}
+        if arg_names:
             selected_account = self.select_github_account()
             if not selected_account:
                 return
-            account = selected_account['name']
-            github_user = selected_account.get('githubUser', selected_account.get('username', ''))
-            ssh_alias = selected_account['sshAlias']
-            git_email = selected_account['email']
             try:
                 token = self.get_github_token(selected_account)
             except ValueError as e:
                 print(str(e))
                 return
-        else:
-            account = None
-            github_user = None
-            ssh_alias = None
-            git_email = None
-            token = None
+            context = {
+                'account': selected_account['name'],
+                'github_user': selected_account.get('githubUser', selected_account.get('username', '')),
+                'ssh_alias': selected_account['sshAlias'],
+                'git_email': selected_account['email'],
+                'token': token,
+            }
 
         # Execute the selected action
-        if action == "setup":
-            self.setup_menu()
-        elif action == "clone":
-            self.handle_clone(account, github_user, ssh_alias, git_email)
-        elif action == "push":
-            self.handle_push(account, github_user, ssh_alias, git_email)
-        elif action == "pull":
-            self.handle_pull()
-        elif action == "adduser":
-            self.handle_adduser()
-        elif action == "showuser":
-            self.handle_showuser()
-        elif action == "addremote":
-            self.handle_addremote(account, token, github_user, ssh_alias, git_email)
-        elif action == "delremote":
-            self.handle_delremote(account, token, github_user)
-        elif action == "remotelist":
-            self.handle_remotelist(token, github_user)
-        elif action == "status":
-            self.get_git_repository_info()
-        elif action == "commit":
-            self.invoke_git_commit()
-        elif action == "history":
-            self.show_git_history()
-        elif action == "tokeninfo":
-            print("\n🔐 GitHub Token Information")
-            print("──────────────────────────────────────────────")
-            try:
-                token = self.get_github_token(account)
-                self.test_github_token_scopes(token, account)
-            except ValueError as e:
-                print(str(e))
-        elif action == "branch":
-            self.handle_branch()
-        elif action == "changename":
-            self.handle_changename(account, token, github_user)
-        elif action == "help":
-            self.handle_help()
-        else:
-            print("\n❌ Invalid action. Please enter one of the following:")
-            print("   → clone / push / pull / adduser / showuser / addremote / delremote / remotelist / status / commit / history / tokeninfo / setup / branch / remotem / changename / help")
-
+        handler(self, *(context[name] for name in arg_names))
 
 if __name__ == "__main__":
     gitgo = GitGo()
-    gitgo.run()
\ No newline at end of file
+    try:
+        gitgo.run()
+    finally:
+        gitgo.close()
\ No newline at end of file